@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable
+
+import aiohttp
+
+from .scraper import (
+    USER_AGENT,
+    PageContent,
+    ScraperError,
+    cache_page,
+    decode_html,
+    extract_sentences,
+    get_cached_page,
+    summarize_sentences,
+)
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> str:
+    try:
+        async with session.get(url) as response:
+            if not response.ok:
+                raise ScraperError(
+                    f"Unexpected status code {response.status} while fetching '{url}'"
+                )
+            content = await response.read()
+            declared_encoding = response.charset
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        raise ScraperError(f"Network error while fetching '{url}': {exc}") from exc
+
+    try:
+        return decode_html(content, declared_encoding)
+    except UnicodeDecodeError as exc:
+        raise ScraperError(f"Unable to decode the page at '{url}': {exc}") from exc
+
+
+def create_session(timeout: int = 15) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        headers={"User-Agent": USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    )
+
+
+async def fetch_many(
+    urls: Iterable[str],
+    concurrency: int = 16,
+    timeout: int = 15,
+) -> list[str | BaseException]:
+    """Fetch several URLs concurrently.
+
+    Results are returned in input order; failed fetches appear as the
+    raised exception instead of the HTML text.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_fetch(session: aiohttp.ClientSession, url: str) -> str:
+        async with semaphore:
+            return await _fetch(session, url)
+
+    async with create_session(timeout) as session:
+        return await asyncio.gather(
+            *(bounded_fetch(session, url) for url in urls),
+            return_exceptions=True,
+        )
+
+
+async def fetch_and_extract_async(
+    session: aiohttp.ClientSession, url: str
+) -> PageContent:
+    """Return the parsed content for ``url``, reusing recent results."""
+    page = get_cached_page(url)
+    if page is not None:
+        return page
+
+    html = await _fetch(session, url)
+    # Parsing is CPU-bound; keep it off the event loop.
+    page = await asyncio.to_thread(extract_sentences, html)
+
+    cache_page(url, page)
+    return page
+
+
+async def run_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    sentences: int,
+    min_chars: int,
+) -> tuple[PageContent, list[str]]:
+    page = await fetch_and_extract_async(session, url)
+    summary = await asyncio.to_thread(
+        summarize_sentences,
+        page.sentences,
+        max_sentences=sentences,
+        min_chars=min_chars,
+    )
+    return page, summary
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import logging
 import re
-from collections import Counter
-from dataclasses import dataclass
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 from heapq import nlargest
+from itertools import chain, filterfalse
 from pathlib import Path
 from typing import Iterable
 
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
 
 
 USER_AGENT = (
@@ -19,7 +32,7 @@ USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "a",
     "about",
     "above",
@@ -144,30 +157,56 @@ STOP_WORDS = {
     "yours",
     "yourself",
     "yourselves",
-}
+})
+
+IGNORED_TAGS = ("script", "style", "noscript", "header", "footer", "form")
+
+PAGE_CACHE_SIZE = 128
+PAGE_CACHE_TTL = 600  # seconds
+
+_META_CHARSET_RE = re.compile(rb'charset=["\']?([\w-]+)', re.IGNORECASE)
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-zA-Z]+")
 
 
 class ScraperError(RuntimeError):
     """Custom error type for scraper failures."""
 
 
-@dataclass
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+_page_cache: OrderedDict[str, tuple[float, PageContent]] = OrderedDict()
+
+
+@dataclass(slots=True)
 class PageContent:
     title: str
     sentences: list[str]
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def text(self) -> str:
-        return " ".join(self.sentences)
+        if self._text is None:
+            self._text = " ".join(self.sentences)
+        return self._text
 
 
 def fetch_html(url: str, timeout: int = 15) -> str:
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=timeout,
-        )
+        response = _SESSION.get(url, timeout=timeout)
     except requests.RequestException as exc:
         raise ScraperError(f"Network error while fetching '{url}': {exc}") from exc
 
@@ -176,26 +215,124 @@ def fetch_html(url: str, timeout: int = 15) -> str:
             f"Unexpected status code {response.status_code} while fetching '{url}'"
         )
 
-    response.encoding = response.apparent_encoding or response.encoding
-    return response.text
+    return decode_html(response.content, _declared_encoding(response))
 
 
-def extract_sentences(html: str) -> PageContent:
-    soup = BeautifulSoup(html, "lxml")
+def decode_html(content: bytes, declared_encoding: str | None = None) -> str:
+    encoding = _known_encoding(declared_encoding) or _meta_encoding(content)
 
-    for tag in soup(["script", "style", "noscript", "header", "footer", "form"]):
-        tag.decompose()
+    try:
+        return content.decode(encoding or "utf-8")
+    except UnicodeDecodeError:
+        # Only fall back to chardet's full-body scan when the cheap guess fails.
+        detected = _known_encoding(chardet.detect(content)["encoding"])
+        return content.decode(detected or "utf-8", errors="replace")
 
-    title_tag = soup.find("title")
-    title = title_tag.text.strip() if title_tag and title_tag.text else "Untitled page"
 
-    paragraphs = [p.get_text(separator=" ", strip=True) for p in soup.find_all("p")]
-    if not paragraphs:
-        raw_text = soup.get_text(separator=" ")
+def _declared_encoding(response: requests.Response) -> str | None:
+    # requests defaults text/* to ISO-8859-1 when no charset is sent; ignore that.
+    content_type = response.headers.get("Content-Type", "").lower()
+    if "charset=" not in content_type:
+        return None
+    return _known_encoding(response.encoding)
+
+
+def _meta_encoding(content: bytes) -> str | None:
+    match = _META_CHARSET_RE.search(content[:1024])
+    return _known_encoding(match.group(1).decode("ascii")) if match else None
+
+
+def _known_encoding(name: str | None) -> str | None:
+    if not name:
+        return None
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
+def fetch_and_parse(url: str, timeout: int = 15) -> PageContent:
+    try:
+        with _SESSION.get(url, timeout=timeout, stream=True) as response:
+            if not response.ok:
+                raise ScraperError(
+                    f"Unexpected status code {response.status_code} while fetching '{url}'"
+                )
+
+            chunks = response.iter_content(chunk_size=64 * 1024)
+            head = next(chunks, b"")
+            # Same order as decode_html: header, then <meta>, then UTF-8.
+            encoding = (
+                _declared_encoding(response) or _meta_encoding(head) or "utf-8"
+            )
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                parser = lxml.html.HTMLParser(encoding="utf-8")
+
+            parser.feed(head)
+            for chunk in chunks:
+                parser.feed(chunk)
+            root = parser.close()
+    except requests.RequestException as exc:
+        raise ScraperError(f"Network error while fetching '{url}': {exc}") from exc
+    except etree.LxmlError as exc:
+        raise ScraperError(f"Unable to parse the page at '{url}': {exc}") from exc
+
+    if root is None:
+        raise ScraperError("Unable to extract textual content from the page.")
+
+    title, cleaned = _extract_text_lxml(root)
+    return _build_page(title, cleaned)
+
+
+def get_cached_page(url: str) -> PageContent | None:
+    entry = _page_cache.get(url)
+    if entry is None:
+        return None
+
+    stored_at, page = entry
+    if time.monotonic() - stored_at >= PAGE_CACHE_TTL:
+        del _page_cache[url]
+        return None
+
+    _page_cache.move_to_end(url)
+    return page
+
+
+def cache_page(url: str, page: PageContent) -> None:
+    _page_cache[url] = (time.monotonic(), page)
+    _page_cache.move_to_end(url)
+    if len(_page_cache) > PAGE_CACHE_SIZE:
+        _page_cache.popitem(last=False)
+
+
+def fetch_and_extract(url: str) -> PageContent:
+    """Return the parsed content for ``url``, reusing recent results."""
+    page = get_cached_page(url)
+    if page is None:
+        page = fetch_and_parse(url)
+        cache_page(url, page)
+    return page
+
+
+def extract_sentences(html: str) -> PageContent:
+    if LexborHTMLParser is not None:
+        title, cleaned = _extract_text_selectolax(html)
+        return _build_page(title, cleaned)
+
+    try:
+        tree = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        title, cleaned = _extract_text_bs4(html)
     else:
-        raw_text = " ".join(paragraphs)
+        title, cleaned = _extract_text_lxml(tree)
 
-    cleaned = re.sub(r"\s+", " ", raw_text).strip()
+    return _build_page(title, cleaned)
+
+
+def _build_page(title: str, cleaned: str) -> PageContent:
     if not cleaned:
         raise ScraperError("Unable to extract textual content from the page.")
 
@@ -203,9 +340,49 @@ def extract_sentences(html: str) -> PageContent:
     return PageContent(title=title, sentences=sentences)
 
 
+def _extract_text_selectolax(html: str) -> tuple[str, str]:
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(IGNORED_TAGS))
+
+    title_node = tree.css_first("title")
+    title = (title_node.text(strip=True) if title_node else "") or "Untitled page"
+
+    parts = [" ".join(p.text(separator=" ").split()) for p in tree.css("p")]
+    if not parts:
+        text = tree.root.text(separator=" ") if tree.root is not None else ""
+        return title, " ".join(text.split())
+    return title, " ".join(part for part in parts if part)
+
+
+def _extract_text_lxml(tree: lxml.html.HtmlElement) -> tuple[str, str]:
+    etree.strip_elements(tree, *IGNORED_TAGS, with_tail=False)
+
+    title = (tree.findtext(".//title") or "").strip() or "Untitled page"
+
+    # itertext() keeps text from sibling nodes apart, unlike text_content().
+    parts = [" ".join(" ".join(p.itertext()).split()) for p in tree.xpath("//p")]
+    if not parts:
+        return title, " ".join(" ".join(tree.itertext()).split())
+    return title, " ".join(part for part in parts if part)
+
+
+def _extract_text_bs4(html: str) -> tuple[str, str]:
+    soup = BeautifulSoup(html, "lxml")
+
+    for tag in soup(list(IGNORED_TAGS)):
+        tag.decompose()
+
+    title_tag = soup.find("title")
+    title = title_tag.text.strip() if title_tag and title_tag.text else "Untitled page"
+
+    parts = [" ".join(p.get_text(separator=" ").split()) for p in soup.find_all("p")]
+    if not parts:
+        return title, " ".join(soup.get_text(separator=" ").split())
+    return title, " ".join(part for part in parts if part)
+
+
 def split_sentences(text: str) -> list[str]:
-    sentence_endings = re.compile(r"(?<=[.!?])\s+")
-    candidates = sentence_endings.split(text)
+    candidates = _SENT_RE.split(text)
     normalized = [candidate.strip() for candidate in candidates if candidate.strip()]
     return normalized
 
@@ -222,33 +399,30 @@ def summarize_sentences(
             "Not enough substantial sentences were found to build a summary."
         )
 
-    word_freq = Counter()
-    sentence_scores: dict[str, float] = {}
+    if len(filtered) <= max_sentences:
+        return filtered
 
-    for sentence in filtered:
-        words = tokenize_sentence(sentence)
-        if not words:
-            continue
+    token_lists = [tokenize_sentence(sentence) for sentence in filtered]
 
-        unique_words = set(words)
-        for word in unique_words:
-            word_freq[word] += 1
-
-    if not word_freq:
+    if not any(token_lists):
         raise ScraperError("Failed to compute word frequencies for summarization.")
 
-    for sentence in filtered:
-        words = tokenize_sentence(sentence)
-        sentence_scores[sentence] = sum(word_freq[word] for word in words)
+    scores = _score_sentences(token_lists)
+
+    top_indices = nlargest(max_sentences, range(len(filtered)), key=scores.__getitem__)
+    top_indices.sort()
+    return [filtered[index] for index in top_indices]
 
-    top_sentences = nlargest(max_sentences, filtered, key=sentence_scores.get)
-    top_sentences.sort(key=lambda s: sentences.index(s))
-    return top_sentences
+
+def _score_sentences(token_lists: list[list[str]]) -> list[int]:
+    word_freq = Counter(chain.from_iterable(map(set, token_lists)))
+    get_freq = word_freq.__getitem__
+    return [sum(map(get_freq, words)) for words in token_lists]
 
 
 def tokenize_sentence(sentence: str) -> list[str]:
-    words = re.findall(r"[a-zA-Z]+", sentence.lower())
-    return [word for word in words if word not in STOP_WORDS]
+    words = map(str.lower, _WORD_RE.findall(sentence))
+    return list(filterfalse(STOP_WORDS.__contains__, words))
 
 
 def format_summary(page: PageContent, summary_sentences: list[str]) -> str:
@@ -300,9 +474,17 @@ def configure_logging(debug: bool) -> None:
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
-def run(url: str, *, sentences: int, min_chars: int) -> tuple[PageContent, list[str]]:
-    html = fetch_html(url)
-    page = extract_sentences(html)
+def run(
+    url: str,
+    *,
+    sentences: int,
+    min_chars: int,
+    html: str | None = None,
+) -> tuple[PageContent, list[str]]:
+    if html is None:
+        page = fetch_and_extract(url)
+    else:
+        page = extract_sentences(html)
     summary = summarize_sentences(page.sentences, max_sentences=sentences, min_chars=min_chars)
     return page, summary
 
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-from flask import Flask, render_template, request
+from aiohttp import ClientSession
+from quart import Quart, render_template, request
 
-from .scraper import ScraperError, run
+from .async_fetch import create_session, run_async
+from .scraper import ScraperError
 
 
-def create_app() -> Flask:
-    app = Flask(__name__)
+def create_app() -> Quart:
+    app = Quart(__name__, template_folder="../templates", static_folder="../static")
+
+    def http_session() -> ClientSession:
+        # Created lazily so the app also works without a lifespan (e.g. test_client).
+        session = app.extensions.get("http_session")
+        if session is None or session.closed:
+            session = app.extensions["http_session"] = create_session()
+        return session
+
+    @app.after_serving
+    async def close_http_session():
+        session = app.extensions.pop("http_session", None)
+        if session is not None:
+            await session.close()
 
     @app.get("/")
-    def index():
-        return render_template(
+    async def index():
+        return await render_template(
             "index.html",
             result=None,
             error=None,
@@ -18,10 +33,11 @@ def create_app() -> Flask:
         )
 
     @app.post("/")
-    def summarize():
-        url = request.form.get("url", "").strip()
-        sentences = request.form.get("sentences", "5").strip()
-        min_chars = request.form.get("min_chars", "40").strip()
+    async def summarize():
+        form = await request.form
+        url = form.get("url", "").strip()
+        sentences = form.get("sentences", "5").strip()
+        min_chars = form.get("min_chars", "40").strip()
 
         error = None
         result = None
@@ -38,7 +54,8 @@ def create_app() -> Flask:
                 error = "Please enter a valid URL."
             else:
                 try:
-                    page, summary = run(
+                    page, summary = await run_async(
+                        http_session(),
                         url,
                         sentences=sentences_count,
                         min_chars=min_chars_count,
@@ -52,7 +69,7 @@ def create_app() -> Flask:
                 except ScraperError as exc:
                     error = str(exc)
 
-        return render_template(
+        return await render_template(
             "index.html",
             result=result,
             error=error,
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import pytest
+
+from src import scraper
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    scraper._page_cache.clear()
+    yield
+    scraper._page_cache.clear()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src import async_fetch
+from src.scraper import ScraperError
+
+LATIN1_PAGE = (
+    "<html><head><meta charset='iso-8859-1'><title>L</title></head>"
+    "<body><p>Café crème is served here.</p></body></html>"
+).encode("latin-1")
+
+
+def _page_app(hits: list[str]) -> web.Application:
+    async def latin1(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        # No charset in Content-Type; only <meta> declares the encoding.
+        return web.Response(body=LATIN1_PAGE, headers={"Content-Type": "text/html"})
+
+    app = web.Application()
+    app.router.add_get("/latin1", latin1)
+    return app
+
+
+def test_fetch_many_decodes_and_reports_errors():
+    async def scenario():
+        async with TestServer(_page_app([])) as server:
+            urls = [str(server.make_url("/latin1")), str(server.make_url("/missing"))]
+            return await async_fetch.fetch_many(urls)
+
+    html, error = asyncio.run(scenario())
+    assert "Café crème" in html
+    assert isinstance(error, ScraperError)
+    assert "404" in str(error)
+
+
+def test_fetch_many_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def slow(request: web.Request) -> web.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return web.Response(text=request.match_info["n"], content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{n}", slow)
+
+    async def scenario():
+        async with TestServer(app) as server:
+            urls = [str(server.make_url(f"/{n}")) for n in range(6)]
+            return await async_fetch.fetch_many(urls, concurrency=2)
+
+    assert asyncio.run(scenario()) == [str(n) for n in range(6)]
+    assert peak == 2
+
+
+def test_run_async_caches_parsed_pages():
+    hits: list[str] = []
+
+    async def scenario():
+        async with TestServer(_page_app(hits)) as server:
+            url = str(server.make_url("/latin1"))
+            async with async_fetch.create_session() as session:
+                return [
+                    await async_fetch.run_async(
+                        session, url, sentences=1, min_chars=5
+                    )
+                    for _ in range(2)
+                ]
+
+    (page, summary), (cached_page, _) = asyncio.run(scenario())
+    assert page.title == "L"
+    assert summary == ["Café crème is served here."]
+    assert cached_page is page
+    assert hits == ["/latin1"]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import lxml.html
+import pytest
+
+from src import scraper
+from src.scraper import ScraperError
+
+
+@pytest.fixture
+def http_server():
+    pages: dict[str, tuple[str, bytes]] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in pages:
+                self.send_response(404)
+                self.end_headers()
+                return
+            content_type, body = pages[self.path]
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", pages
+    server.shutdown()
+    server.server_close()
+
+
+def test_lxml_extraction_keeps_word_boundaries():
+    html = (
+        "<html><head><title>T</title></head><body>"
+        "<p>line one<br>line two. More <b>bold</b>text!</p></body></html>"
+    )
+    title, text = scraper._extract_text_lxml(lxml.html.fromstring(html))
+    assert title == "T"
+    assert text == "line one line two. More bold text!"
+
+
+def test_lxml_extraction_falls_back_to_document_text():
+    html = (
+        "<html><head><title>T</title></head><body><!-- note -->"
+        "<div>Alpha beta.</div><div>Second</div><script>run()</script></body></html>"
+    )
+    assert scraper._extract_text_lxml(lxml.html.fromstring(html)) == (
+        "T",
+        "T Alpha beta. Second",
+    )
+
+
+def test_extract_sentences_rejects_empty_page():
+    with pytest.raises(ScraperError):
+        scraper.extract_sentences("<html><body><p>  </p></body></html>")
+
+
+EXTRACTION_CASES = [
+    (
+        "<html><head><title>T</title><style>p {}</style></head><body>"
+        "<header>Site</header><p>line one<br>line two. More <b>bold</b>text!</p>"
+        "<p></p><p>Next &amp; last.</p></body></html>",
+        ("T", "line one line two. More bold text! Next & last."),
+    ),
+    (
+        "<html><head><title>T</title></head><body><!-- note -->"
+        "<div>Alpha beta.</div><div>Second</div><script>run()</script></body></html>",
+        ("T", "T Alpha beta. Second"),
+    ),
+]
+
+
+@pytest.mark.parametrize(("html", "expected"), EXTRACTION_CASES)
+def test_extractors_agree(html, expected):
+    assert scraper._extract_text_lxml(lxml.html.fromstring(html)) == expected
+    assert scraper._extract_text_bs4(html) == expected
+    if scraper.LexborHTMLParser is not None:
+        assert scraper._extract_text_selectolax(html) == expected
+
+
+def test_score_sentences_counts_documents_per_word():
+    token_lists = [["cat", "cat", "dog"], ["dog"], []]
+    assert scraper._score_sentences(token_lists) == [1 + 1 + 2, 2, 0]
+
+
+def test_summarize_sentences_keeps_document_order():
+    sentences = [
+        "Cats and dogs are friends.",
+        "Bananas grow in warm places.",
+        "Dogs chase cats in the yard.",
+        "Cats and dogs are friends.",
+    ]
+    summary = scraper.summarize_sentences(sentences, max_sentences=2, min_chars=10)
+    assert summary == [sentences[0], sentences[2]]
+
+
+def test_summarize_sentences_returns_short_input_unchanged():
+    sentences = ["Short one here.", "Another short one."]
+    summary = scraper.summarize_sentences(sentences, max_sentences=5, min_chars=5)
+    assert summary == sentences
+
+
+def test_decode_html_uses_meta_charset():
+    html = "<meta charset='iso-8859-1'><p>Café crème</p>".encode("latin-1")
+    assert scraper.decode_html(html).endswith("<p>Café crème</p>")
+
+
+def test_decode_html_prefers_declared_charset():
+    assert scraper.decode_html("Привет".encode("cp1251"), "windows-1251") == "Привет"
+
+
+def test_decode_html_defaults_to_utf8_and_ignores_unknown_charset():
+    assert scraper.decode_html("Café".encode("utf-8")) == "Café"
+    assert scraper.decode_html("Café".encode("utf-8"), "foobar") == "Café"
+
+
+def test_fetch_html_decodes_with_meta_charset(http_server):
+    base_url, pages = http_server
+    pages["/latin1"] = (
+        "text/html",
+        "<meta charset='iso-8859-1'><p>Café crème</p>".encode("latin-1"),
+    )
+    assert scraper.fetch_html(f"{base_url}/latin1").endswith("<p>Café crème</p>")
+
+
+@pytest.mark.parametrize(
+    ("content_type", "body"),
+    [
+        ("text/html", "<title>Café</title><p>Crème brûlée is sweet.</p>".encode()),
+        (
+            "text/html",
+            "<meta charset='iso-8859-1'><title>Café</title>"
+            "<p>Crème brûlée is sweet.</p>".encode("latin-1"),
+        ),
+        (
+            "text/html; charset=foobar",
+            "<title>Café</title><p>Crème brûlée is sweet.</p>".encode(),
+        ),
+    ],
+    ids=["utf8-undeclared", "meta-latin1", "unknown-charset"],
+)
+def test_fetch_and_parse_matches_decode_html(http_server, content_type, body):
+    base_url, pages = http_server
+    pages["/page"] = (content_type, body)
+    page = scraper.fetch_and_parse(f"{base_url}/page")
+    assert page.title == "Café"
+    assert page.sentences == ["Crème brûlée is sweet."]
+    assert page == scraper.extract_sentences(scraper.fetch_html(f"{base_url}/page"))
+
+
+def test_fetch_and_parse_reports_bad_status(http_server):
+    base_url, _ = http_server
+    with pytest.raises(ScraperError, match="404"):
+        scraper.fetch_and_parse(f"{base_url}/missing")
+
+
+def test_fetch_and_parse_rejects_empty_body(http_server):
+    base_url, pages = http_server
+    pages["/empty"] = ("text/html", b"")
+    with pytest.raises(ScraperError):
+        scraper.fetch_and_parse(f"{base_url}/empty")
+
+
+def test_fetch_and_extract_reuses_cached_page(http_server, monkeypatch):
+    base_url, pages = http_server
+    pages["/page"] = ("text/html", b"<p>First version of the page.</p>")
+    url = f"{base_url}/page"
+
+    first = scraper.fetch_and_extract(url)
+    pages["/page"] = ("text/html", b"<p>Second version of the page.</p>")
+    assert scraper.fetch_and_extract(url) is first
+
+    monkeypatch.setattr(scraper, "PAGE_CACHE_TTL", 0)
+    assert scraper.fetch_and_extract(url).sentences == ["Second version of the page."]
+
+
+def test_page_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(scraper, "PAGE_CACHE_SIZE", 2)
+    pages = {url: scraper.PageContent(title=url, sentences=[]) for url in "abc"}
+
+    scraper.cache_page("a", pages["a"])
+    scraper.cache_page("b", pages["b"])
+    assert scraper.get_cached_page("a") is pages["a"]
+    scraper.cache_page("c", pages["c"])
+
+    assert scraper.get_cached_page("b") is None
+    assert scraper.get_cached_page("a") is pages["a"]
+    assert scraper.get_cached_page("c") is pages["c"]
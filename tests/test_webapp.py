@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webapp import create_app
+
+PAGE = (
+    "<html><head><title>Demo</title></head><body>"
+    "<p>Servers cache pages for speed. Servers also compress pages.</p>"
+    "<p>Bananas are yellow.</p></body></html>"
+)
+
+
+def _page_app() -> web.Application:
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(text=PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    return app
+
+
+def _post(form: dict[str, str], *, lifespan: bool = True) -> tuple[int, str]:
+    app = create_app()
+
+    async def scenario():
+        async with TestServer(_page_app()) as server:
+            path = form.pop("path", "/page")
+            form.setdefault("url", str(server.make_url(path)))
+            if lifespan:
+                async with app.test_app() as test_app:
+                    response = await test_app.test_client().post("/", form=form)
+                    return response.status_code, await response.get_data(as_text=True)
+
+            client = app.test_client()
+            response = await client.post("/", form=form)
+            body = await response.get_data(as_text=True)
+            session = app.extensions.pop("http_session", None)
+            if session is not None:
+                await session.close()
+            return response.status_code, body
+
+    return asyncio.run(scenario())
+
+
+def test_index_renders_form():
+    app = create_app()
+
+    async def scenario():
+        async with app.test_app() as test_app:
+            response = await test_app.test_client().get("/")
+            return response.status_code, await response.get_data(as_text=True)
+
+    status, body = asyncio.run(scenario())
+    assert status == 200
+    assert "<form" in body
+
+
+def test_summarize_returns_summary():
+    status, body = _post({"sentences": "1", "min_chars": "10"})
+    assert status == 200
+    assert "<h2>Demo</h2>" in body
+    assert "<li>Servers cache pages for speed.</li>" in body
+
+
+def test_summarize_reports_scraper_errors():
+    status, body = _post({"path": "/missing", "sentences": "1", "min_chars": "10"})
+    assert status == 200
+    assert "Unexpected status code 404" in body
+
+
+def test_summarize_works_without_lifespan():
+    status, body = _post({"sentences": "1", "min_chars": "10"}, lifespan=False)
+    assert status == 200
+    assert "<h2>Demo</h2>" in body